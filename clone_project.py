@@ -7,14 +7,46 @@ filenames.
 Author: Gino Bogo
 """
 
-import configparser
+import argparse
+import codecs
+import collections
+import contextlib
+import ctypes
+import errno
+import functools
+import mmap
 import os
+import queue
 import re
 import shutil
 import sys
+import tempfile
+import threading
+import time
 import tkinter as tk
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from tkinter import filedialog, messagebox, ttk
-from typing import Callable, List, Tuple
+from typing import (
+    Any,
+    AnyStr,
+    BinaryIO,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
 
 # ==============================================================================
 # CONSTANTS
@@ -24,6 +56,23 @@ MIN_WINDOW_SIZE = (600, 650)  # Increased height for progress bar
 LABEL_WIDTH = 20
 ENTRY_WIDTH = 50
 BTN_WIDTH = 10
+LOG_FLUSH_INTERVAL = 0.1  # Seconds between batched GUI log writes
+MAX_LOG_LINES = 5000  # Oldest GUI log lines are dropped beyond this
+EVENT_POLL_INTERVAL = 50  # Milliseconds between GUI polls of the clone worker
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)  # File copy threads (I/O-bound)
+MAX_PENDING_JOBS = 1024  # Files queued ahead of the copy threads
+STREAM_THRESHOLD = 16 * 1024 * 1024  # Files above this size are streamed
+STREAM_CHUNK_SIZE = 4 * 1024 * 1024
+BINARY_SNIFF_SIZE = 8192  # Leading bytes searched for a null byte (as git, grep)
+# Known binary formats, copied as-is without scanning their contents
+BINARY_EXTENSIONS = frozenset(
+    ".7z .a .bmp .class .dll .exe .gif .gz .ico .jar .jpeg .jpg .lib .o .obj"
+    " .pdf .png .pyc .so .tar .zip".split()
+)
+FICLONE = getattr(fcntl, "FICLONE", 0x40049409)  # Linux reflink ioctl
+# FICLONE errors meaning the filesystem cannot share extents at all; EINVAL
+# is left out as it may only concern one file (e.g. an unaligned size)
+REFLINK_UNSUPPORTED_ERRNOS = frozenset({errno.EOPNOTSUPP, errno.EXDEV, errno.ENOTTY})
 
 # ==============================================================================
 # VALIDATION & HELPER FUNCTIONS
@@ -78,12 +127,55 @@ def validate_inputs(
         raise ValueError("Source and destination directories cannot be the same.")
 
 
+def scan_tree(top: str) -> Iterator[Tuple[str, List[str], List[str]]]:
+    """Walk a directory tree top-down with os.scandir, like os.walk.
+
+    Entries are classified from the directory entry type reported by the
+    OS, so no extra stat call is needed. Symlinked directories are listed
+    but not descended into. An explicit stack replaces recursion, so deep
+    trees do not pay for a chain of nested generators.
+    """
+    stack = [top]
+
+    while stack:
+        top = stack.pop()
+        dirs: List[str] = []
+        files: List[str] = []
+        subdirs: List[str] = []
+
+        try:
+            with os.scandir(top) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+
+                    if is_dir:
+                        dirs.append(entry.name)
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    else:
+                        files.append(entry.name)
+        except OSError:
+            continue
+
+        yield top, dirs, files
+
+        # Reversed so subdirectories are popped in listing order
+        stack.extend(reversed(subdirs))
+
+
 def count_files_and_dirs(src_dir: str) -> Tuple[int, int]:
-    """Count total files and directories for progress tracking."""
+    """Count total files and directories in a tree.
+
+    Not used by the clone, which reports progress while it walks; kept as
+    a helper for callers that want the totals upfront.
+    """
     total_dirs = 0
     total_files = 0
 
-    for root, dirs, files in os.walk(src_dir):
+    for root, dirs, files in scan_tree(src_dir):
         total_dirs += len(dirs)
         total_files += len(files)
 
@@ -96,7 +188,7 @@ def count_files_and_dirs(src_dir: str) -> Tuple[int, int]:
 def show_help() -> None:
     """Display CLI usage information."""
     print(
-        "Usage: python clone_project.py <src_dir> <dst_dir> <src_name1,src_name2,...> <dst_name1,dst_name2,...>"
+        "Usage: python clone_project.py [-q] <src_dir> <dst_dir> <src_name1,src_name2,...> <dst_name1,dst_name2,...>"
     )
     print("\nExamples:")
     print("  python clone_project.py /old/proj /new/proj oldname newname")
@@ -104,62 +196,429 @@ def show_help() -> None:
     print(
         '  python clone_project.py /companyA/projX /companyB/projY "companyA,projX" "companyB,projY"'
     )
+    print("\nOptions:")
+    print("  -q, --quiet  Only print warnings, errors and the final summary")
+    print("  --           End of options; later arguments are never options,")
+    print("               e.g. for a name that is literally -q")
     print("\nNote: Number of source names must match number of destination names.")
-    print("Replacements are processed in order - be careful with overlapping patterns.")
+    print("Replacements are applied in a single pass - when names overlap at the")
+    print("same position, the longest one wins.")
     sys.exit(1)
 
 
+# ==============================================================================
+# REPLACEMENT ENGINE
+# ==============================================================================
+
+
+def _overlaps(a: str, b: str) -> bool:
+    """Tell whether occurrences of two names can share characters."""
+    if a in b or b in a:
+        return True
+    return any(
+        a.endswith(b[:k]) or b.endswith(a[:k]) for k in range(1, min(len(a), len(b)))
+    )
+
+
+class NameReplacer:
+    """Replace several literal names in a single left-to-right pass.
+
+    All source names are compiled once into one alternation, so a text is
+    scanned a single time regardless of the number of names. At a given
+    position the longest name wins (leftmost-longest); duplicated source
+    names count against their first occurrence. Pairs whose source and
+    destination are identical always count as zero, and are dropped unless
+    they overlap a name that does change.
+
+    Texts may be ``str`` or UTF-8 encoded bytes (including bytes-like
+    buffers such as ``mmap``); the result has the matching type.
+    """
+
+    def __init__(self, src_names: List[str], dst_names: List[str]) -> None:
+        self.src_names = list(src_names)
+        self.dst_names = list(dst_names)
+        self.dst_bytes = [dst.encode("utf-8") for dst in self.dst_names]
+
+        # Identity pairs never count, whether pruned or kept for shadowing
+        self.unchanged = [
+            i for i, src in enumerate(self.src_names) if self.dst_names[i] == src
+        ]
+
+        first: Dict[str, int] = {}
+        for i, src in enumerate(self.src_names):
+            if src:
+                first.setdefault(src, i)
+
+        # Identity pairs change nothing; keep one only if it overlaps a kept
+        # name, since it may shadow it (directly or through another one)
+        kept = [src for src, i in first.items() if self.dst_names[i] != src]
+        identical = [src for src in first if src not in kept]
+        while kept:
+            shadowing = [s for s in identical if any(_overlaps(s, k) for k in kept)]
+            if not shadowing:
+                break
+            kept += shadowing
+            identical = [src for src in identical if src not in shadowing]
+
+        # Keyed by both the str and the UTF-8 form of each name
+        self.index: Dict[Union[str, bytes], int] = {}
+        for src in sorted(kept, key=first.__getitem__):
+            self.index[src] = first[src]
+            self.index[src.encode("utf-8")] = first[src]
+
+        # Replacement for each key of the index, in the same type as the key
+        self.targets: Dict[Union[str, bytes], Union[str, bytes]] = {
+            src: (self.dst_names[i] if isinstance(src, str) else self.dst_bytes[i])
+            for src, i in self.index.items()
+        }
+
+        # Longest names first, so the alternation prefers the longest match
+        by_length = sorted(self.index, key=len, reverse=True)
+        self.names = names = [src for src in by_length if isinstance(src, str)]
+        self.encoded = encoded = [src for src in by_length if isinstance(src, bytes)]
+
+        # One capturing group, so split() interleaves the matched names
+        self.pattern = (
+            re.compile("(" + "|".join(map(re.escape, names)) + ")") if names else None
+        )
+        self.byte_pattern = (
+            re.compile(b"(" + b"|".join(map(re.escape, encoded)) + b")")
+            if encoded
+            else None
+        )
+
+        # Longest name, i.e. how far a match can reach past its start
+        self.max_len = max(map(len, names), default=0)
+        self.max_byte_len = max(map(len, encoded), default=0)
+
+        # Pure-ASCII names can be replaced in any ASCII-compatible encoding
+        self.ascii = all(n.isascii() for n in self.src_names + self.dst_names)
+
+        # With a single name the plain literal replace needs no regex at all
+        self.single: Optional[Tuple[str, str]] = None
+        self.single_bytes: Optional[Tuple[bytes, bytes]] = None
+        if len(names) == 1:
+            i = self.index[names[0]]
+            self.single = (names[0], self.dst_names[i])
+            self.single_bytes = (encoded[0], self.dst_bytes[i])
+
+        # Several one-character names: renames become a single translate()
+        self.table: Optional[Dict[int, str]] = None
+        if len(names) > 1 and all(len(src) == 1 for src in names):
+            self.table = str.maketrans({src: self.targets[src] for src in names})
+
+    def contains_any(self, text: Any) -> bool:
+        """Tell whether any source name occurs in a str or bytes-like text.
+
+        Each name is located with a plain substring search (memchr-based),
+        which is much cheaper than running the alternation over texts that
+        contain none of the names.
+        """
+        if isinstance(text, str):
+            names = self.names
+        else:
+            names = self.encoded
+
+        # Common single-name case: one search, no generator
+        if len(names) == 1:
+            return text.find(names[0]) != -1
+
+        return any(text.find(src) != -1 for src in names)
+
+    def _tables(self, text: Any) -> Tuple[Optional["re.Pattern[Any]"], List[Any], int]:
+        if isinstance(text, str):
+            return self.pattern, self.dst_names, self.max_len
+        return self.byte_pattern, self.dst_bytes, self.max_byte_len
+
+    def replace(self, text: AnyStr) -> Tuple[AnyStr, List[int]]:
+        """Return the rewritten text and the per-name replacement counts."""
+        counts = [0] * len(self.src_names)
+        if self.single is not None:
+            return self._replace_single(text, counts)
+
+        pattern = self._tables(text)[0]
+        if pattern is None or not self.contains_any(text):
+            return text, counts
+
+        # split() runs the whole scan in C and yields the matched names at
+        # odd positions; counting and mapping them avoids a Python callback
+        # per match as sub() would need
+        parts = pattern.split(text)
+        found = parts[1::2]
+        for src, hits in collections.Counter(found).items():
+            counts[self.index[src]] += hits
+        parts[1::2] = map(self.targets.__getitem__, found)
+
+        return text[:0].join(parts), self._uncount(counts)
+
+    def _uncount(self, counts: List[int]) -> List[int]:
+        for i in self.unchanged:
+            counts[i] = 0
+        return counts
+
+    def _replace_single(self, text: Any, counts: List[int]) -> Tuple[Any, List[int]]:
+        src, dst = self.single if isinstance(text, str) else self.single_bytes
+        if not isinstance(text, (str, bytes)):
+            # Buffers such as mmap have no replace(); copy only on a hit
+            if text.find(src) == -1:
+                return text, counts
+            text = bytes(text)
+
+        # One replace pass; the count follows from the change in length
+        updated = text.replace(src, dst)
+        delta = len(dst) - len(src)
+        counts[self.index[src]] = (
+            (len(updated) - len(text)) // delta if delta else text.count(src)
+        )
+
+        return updated, counts
+
+    def replace_partial(
+        self, text: AnyStr, final: bool
+    ) -> Tuple[AnyStr, AnyStr, List[int]]:
+        """Replace names in one chunk of a longer, streamed text.
+
+        Returns the rewritten part, the unprocessed tail to prepend to the
+        next chunk, and the per-name counts. Only matches that cannot be
+        extended by the next chunk are replaced; with ``final`` set the whole
+        text is processed.
+        """
+        pattern, dsts, max_len = self._tables(text)
+        if final or pattern is None:
+            updated, counts = self.replace(text)
+            return updated, text[:0], counts
+
+        counts = [0] * len(self.src_names)
+        safe = len(text) - max_len + 1
+        parts = []
+        pos = 0
+
+        for match in pattern.finditer(text):
+            if match.start() >= safe:
+                break
+            i = self.index[match.group(0)]
+            counts[i] += 1
+            parts.append(text[pos : match.start()])
+            parts.append(dsts[i])
+            pos = match.end()
+
+        cut = max(pos, safe)
+        parts.append(text[pos:cut])
+
+        return text[:0].join(parts), text[cut:], self._uncount(counts)
+
+    def rename(self, name: str) -> str:
+        """Return a file or directory name with all source names replaced."""
+        if self.single is not None:
+            return name.replace(*self.single)
+        if self.table is not None:
+            return name.translate(self.table)
+        if self.pattern is None or not self.contains_any(name):
+            return name
+
+        # Same split as replace(), minus the counting renames do not need
+        parts = self.pattern.split(name)
+        parts[1::2] = map(self.targets.__getitem__, parts[1::2])
+        return "".join(parts)
+
+
+@functools.lru_cache(maxsize=32)
+def _build_replacer(
+    src_names: Tuple[str, ...], dst_names: Tuple[str, ...]
+) -> NameReplacer:
+    return NameReplacer(list(src_names), list(dst_names))
+
+
+def get_replacer(src_names: List[str], dst_names: List[str]) -> NameReplacer:
+    """Return a cached replacer so the name pattern is compiled only once."""
+    return _build_replacer(tuple(src_names), tuple(dst_names))
+
+
 # ==============================================================================
 # CORE FUNCTIONALITY
 # ==============================================================================
 
 
+def has_binary_extension(file_path: str) -> bool:
+    """Tell whether a file's extension marks a known binary format."""
+    return os.path.splitext(file_path)[1].lower() in BINARY_EXTENSIONS
+
+
+def transform_content(
+    content_bytes: "bytes | mmap.mmap",
+    file_path: str,
+    src_names: List[str],
+    dst_names: List[str],
+    log_func: Callable[[str, str], None],
+    replacer: NameReplacer,
+) -> Tuple[Optional[bytes], List[int]]:
+    """Replace names in raw file content; return None when nothing changed."""
+    counts = [0] * len(src_names)
+
+    # Heuristic: if a null byte leads the file, assume binary
+    if content_bytes.find(b"\x00", 0, BINARY_SNIFF_SIZE) != -1:
+        log_func(f"Skipped file (likely binary): {file_path}", "skipped")
+        return None, counts
+
+    # Most files contain none of the names: copy them untouched
+    if not replacer.contains_any(content_bytes):
+        return None, counts
+
+    # Names are matched on the raw bytes: UTF-8 is self-synchronising, so an
+    # encoded name can only match on character boundaries. Non-ASCII names
+    # still require the file itself to be valid UTF-8.
+    if not replacer.ascii:
+        try:
+            str(content_bytes, "utf-8")
+        except UnicodeDecodeError:
+            log_func(f"Skipped file (not UTF-8 decodable): {file_path}", "skipped")
+            return None, counts
+
+    updated, counts = replacer.replace(content_bytes)
+    if sum(counts) == 0:
+        return None, counts
+
+    return updated, counts
+
+
+def stream_replace_file(
+    src_file: str,
+    dst_file: str,
+    src_names: List[str],
+    dst_names: List[str],
+    log_func: Callable[[str, str], None],
+    replacer: NameReplacer,
+) -> Tuple[bool, List[int]]:
+    """Replace names in a large file chunk by chunk, with bounded memory.
+
+    The output goes to a temporary file next to ``dst_file``, which replaces
+    it only when names were actually replaced. ``src_file`` and ``dst_file``
+    may be the same path. Returns whether the destination was written.
+    """
+    counts = [0] * len(src_names)
+    decoder = None if replacer.ascii else codecs.getincrementaldecoder("utf-8")()
+    tail = b""
+    offset = 0
+
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=".clone-", dir=os.path.dirname(os.path.abspath(dst_file))
+    )
+    try:
+        with os.fdopen(fd, "wb") as out, open(src_file, "rb") as f:
+            while True:
+                chunk = f.read(STREAM_CHUNK_SIZE)
+                final = not chunk
+
+                # Heuristic: if a null byte leads the file, assume binary
+                if (
+                    offset < BINARY_SNIFF_SIZE
+                    and chunk.find(b"\x00", 0, BINARY_SNIFF_SIZE - offset) != -1
+                ):
+                    log_func(f"Skipped file (likely binary): {dst_file}", "skipped")
+                    counts = [0] * len(src_names)
+                    break
+
+                if decoder is not None:
+                    try:
+                        decoder.decode(chunk, final)
+                    except UnicodeDecodeError:
+                        log_func(
+                            f"Skipped file (not UTF-8 decodable): {dst_file}",
+                            "skipped",
+                        )
+                        counts = [0] * len(src_names)
+                        break
+
+                offset += len(chunk)
+                updated, tail, chunk_counts = replacer.replace_partial(
+                    tail + chunk, final
+                )
+                out.write(updated)
+                counts = [a + b for a, b in zip(counts, chunk_counts)]
+
+                if final:
+                    break
+
+        if sum(counts) == 0:
+            os.remove(tmp_path)
+            return False, counts
+
+        shutil.copymode(src_file, tmp_path)
+        os.replace(tmp_path, dst_file)
+        return True, counts
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def log_replacements(
+    file_path: str,
+    src_names: List[str],
+    dst_names: List[str],
+    counts: List[int],
+    log_func: Callable[[str, str], None],
+) -> None:
+    """Log the replacements made in a file as one line, with a per-name
+    breakdown when more than one name was replaced."""
+    total_repl = sum(counts)
+    repl_made = [
+        f"'{src}'→'{dst}':{count}"
+        for src, dst, count in zip(src_names, dst_names, counts)
+        if count > 0
+    ]
+    breakdown = f": {', '.join(repl_made)}" if len(repl_made) > 1 else ""
+
+    norm_path = os.path.normpath(file_path)
+    log_func(
+        f"Updated contents of: {norm_path} ({total_repl} replacements{breakdown})",
+        "normal",
+    )
+
+
+def write_file(file_path: str, data: bytes) -> None:
+    """Write bytes to a file with raw OS calls, truncating it first.
+
+    Skips the buffered file object, which costs an extra fstat and isatty
+    check per file; the whole buffer usually goes out in one write call.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(file_path, flags, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
 def process_file_content(
     file_path: str,
     src_names: List[str],
     dst_names: List[str],
     log_func: Callable[[str, str], None],
+    replacer: Optional[NameReplacer] = None,
 ) -> List[int]:
-    """Process file content replacements."""
+    """Replace names in a file in place, reading it whole into memory.
+
+    In-place API only: the clone itself goes through clone_file, which
+    reads each source once and writes the destination once.
+    """
     counts = [0] * len(src_names)
+    if replacer is None:
+        replacer = get_replacer(src_names, dst_names)
 
     try:
         with open(file_path, "rb") as f:
             content_bytes = f.read()
 
-        # Heuristic: if null byte is present, assume binary
-        if b"\x00" in content_bytes:
-            log_func(f"Skipped file (likely binary): {file_path}", "skipped")
-            return counts
-
-        try:
-            content = content_bytes.decode("utf-8")
-        except UnicodeDecodeError:
-            log_func(f"Skipped file (not UTF-8 decodable): {file_path}", "skipped")
-            return counts
+        updated, counts = transform_content(
+            content_bytes, file_path, src_names, dst_names, log_func, replacer
+        )
 
-        updated = content
-        total_repl = 0
-        repl_made = []
-
-        for i, (src, dst) in enumerate(zip(src_names, dst_names)):
-            repl_count = updated.count(src)
-            if repl_count > 0:
-                updated = updated.replace(src, dst)
-                total_repl += repl_count
-                counts[i] += repl_count
-                repl_made.append(f"'{src}'→'{dst}':{repl_count}")
-
-        if total_repl > 0:
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(updated)
-            norm_path = os.path.normpath(file_path)
-            log_func(
-                f"Updated contents of: {norm_path} ({total_repl} replacements)",
-                "normal",
-            )
-            if len(repl_made) > 1:
-                log_func(f"  Breakdown: {', '.join(repl_made)}", "normal")
+        if updated is not None:
+            write_file(file_path, updated)
+            log_replacements(file_path, src_names, dst_names, counts, log_func)
 
         return counts
     except IOError:
@@ -172,9 +631,183 @@ def replace_in_contents(
     src_names: List[str],
     dst_names: List[str],
     log_func: Callable[[str, str], None],
+    replacer: Optional[NameReplacer] = None,
 ) -> List[int]:
-    """Replace text content in a file, skipping binary/unreadable files."""
-    return process_file_content(file_path, src_names, dst_names, log_func)
+    """Replace text content in a file, skipping binary/unreadable files.
+
+    In-place API only; see process_file_content.
+    """
+    return process_file_content(file_path, src_names, dst_names, log_func, replacer)
+
+
+@functools.lru_cache(maxsize=None)
+def _clonefile_func() -> Any:
+    return getattr(ctypes.CDLL(None, use_errno=True), "clonefile", None)
+
+
+# Destination devices that refused a reflink; FICLONE is not retried there
+_reflink_unsupported: Set[int] = set()
+
+
+def reflink_fd(src_fd: int, dst_fd: int) -> bool:
+    """Clone a file's data with a copy-on-write FICLONE reflink, if supported.
+
+    Works on Linux filesystems that share extents (btrfs, XFS, ...). A
+    device that refuses the ioctl is remembered, so later files copied to
+    it skip the attempt. Returns False when no reflink was made.
+    """
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+
+    dev = os.fstat(dst_fd).st_dev
+    if dev in _reflink_unsupported:
+        return False
+
+    try:
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        return True
+    except OSError as e:
+        if e.errno in REFLINK_UNSUPPORTED_ERRNOS:
+            _reflink_unsupported.add(dev)
+        return False
+
+
+def copy_range_fd(src_fd: int, dst_fd: int) -> bool:
+    """Copy a file's data inside the kernel with copy_file_range(2).
+
+    The data never passes through user space, and some filesystems (NFS,
+    btrfs, XFS) copy server-side or share extents. Both descriptors must
+    be at offset 0. Returns False when the call is unavailable or refused,
+    e.g. across filesystems on older kernels.
+    """
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is None:
+        return False
+
+    remaining = os.fstat(src_fd).st_size
+    if remaining == 0:
+        # Empty, or a special file whose size is not known upfront
+        return False
+
+    try:
+        while remaining > 0:
+            copied = copy_range(src_fd, dst_fd, remaining)
+            if copied == 0:
+                break
+            remaining -= copied
+        return True
+    except OSError:
+        return False
+
+
+def copy_file(src_file: str, dst_file: str, src: Optional[BinaryIO] = None) -> None:
+    """Copy a file with its metadata, sharing its data blocks when possible.
+
+    The source and destination are opened once, and a reflink and then an
+    in-kernel copy are tried on those descriptors; pass ``src`` to reuse a
+    source file that is already open at offset 0.
+    """
+    # clonefile(2) and CopyFileW create the destination themselves
+    if sys.platform == "darwin":
+        clonefile = _clonefile_func()
+        if (
+            clonefile
+            and clonefile(os.fsencode(src_file), os.fsencode(dst_file), 0) == 0
+        ):
+            shutil.copystat(src_file, dst_file)
+            return
+    elif sys.platform == "win32":
+        kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+        if kernel32.CopyFileW(src_file, dst_file, False):
+            shutil.copystat(src_file, dst_file)
+            return
+
+    with contextlib.ExitStack() as stack:
+        fsrc = src or stack.enter_context(open(src_file, "rb"))
+        fdst = stack.enter_context(open(dst_file, "wb"))
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        copied = reflink_fd(src_fd, dst_fd) or copy_range_fd(src_fd, dst_fd)
+
+    # Rare: shutil rewrites the file, using sendfile(2) where available
+    if not copied:
+        shutil.copyfile(src_file, dst_file)
+    shutil.copystat(src_file, dst_file)
+
+
+def discard_tree(path: str) -> Optional[threading.Thread]:
+    """Move a directory tree out of the way and delete it in the background.
+
+    The tree is renamed to a unique sibling first, so its name is free as
+    soon as this returns; join the returned thread to wait for the delete.
+    If the rename fails the tree is deleted in place and None is returned.
+    """
+    old_path = f"{path}.old-{uuid.uuid4().hex[:8]}"
+    try:
+        os.rename(path, old_path)
+    except OSError:
+        shutil.rmtree(path)
+        return None
+
+    cleanup = threading.Thread(
+        target=shutil.rmtree, args=(old_path,), kwargs={"ignore_errors": True}
+    )
+    cleanup.start()
+    return cleanup
+
+
+def clone_file(
+    src_file: str,
+    dst_file: str,
+    src_names: List[str],
+    dst_names: List[str],
+    log_func: Callable[[str, str], None],
+    replacer: Optional[NameReplacer] = None,
+) -> List[int]:
+    """Copy a single file, replacing names in its contents in the same pass.
+
+    The source is read once and, when names were replaced, the result is
+    written once; unchanged and binary files are copied as-is.
+    """
+    if replacer is None:
+        replacer = get_replacer(src_names, dst_names)
+
+    if has_binary_extension(src_file):
+        log_func(f"Skipped file (likely binary): {dst_file}", "skipped")
+        copy_file(src_file, dst_file)
+        return [0] * len(src_names)
+
+    if os.path.getsize(src_file) > STREAM_THRESHOLD:
+        replaced, counts = stream_replace_file(
+            src_file, dst_file, src_names, dst_names, log_func, replacer
+        )
+        if not replaced:
+            copy_file(src_file, dst_file)
+            return counts
+        shutil.copystat(src_file, dst_file)
+        log_replacements(dst_file, src_names, dst_names, counts, log_func)
+        return counts
+
+    # Scan and replace straight from a read-only mapping of the source, so
+    # skipped files are never copied into a Python buffer
+    with open(src_file, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            updated, counts = None, [0] * len(src_names)
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                updated, counts = transform_content(
+                    content, dst_file, src_names, dst_names, log_func, replacer
+                )
+
+        # Unchanged files are copied from the handle that was just scanned
+        if updated is None:
+            copy_file(src_file, dst_file, f)
+            return counts
+
+    write_file(dst_file, updated)
+    shutil.copystat(src_file, dst_file)
+    log_replacements(dst_file, src_names, dst_names, counts, log_func)
+
+    return counts
 
 
 def get_dst_root_path(
@@ -185,10 +818,7 @@ def get_dst_root_path(
 ) -> tuple[str, int]:
     """Calculate destination root path and determine if it was renamed."""
     src_base = os.path.basename(src_dir)
-    dst_base = src_base
-
-    for src, dst in zip(src_names, dst_names):
-        dst_base = re.sub(re.escape(src), dst, dst_base)
+    dst_base = get_replacer(src_names, dst_names).rename(src_base)
 
     # Check if the destination directory already includes the target project name
     if os.path.basename(os.path.normpath(dst_dir)) == dst_base:
@@ -201,6 +831,20 @@ def get_dst_root_path(
     return dst_root, was_renamed
 
 
+# Per-name counts and buffered log lines returned by a file copy job
+JobResult = Tuple[List[int], List[Tuple[str, str]]]
+
+
+class CloneStats(NamedTuple):
+    """Totals of a clone operation; unpacks like a plain tuple."""
+
+    total_dirs: int
+    total_files: int
+    dirs_renamed: int
+    files_renamed: int
+    name_counts: List[int]
+
+
 def copy_and_replace(
     src_dir: str,
     dst_dir: str,
@@ -208,7 +852,7 @@ def copy_and_replace(
     dst_names: List[str],
     log_func: Callable[[str, str], None],
     prog_cb: Callable[[str, int, int], None],
-) -> tuple[int, int, int, int, List[int]]:
+) -> CloneStats:
     """Copy directory structure while replacing names in contents and filenames."""
     log_func("Replacement mapping:", "info")
 
@@ -217,8 +861,13 @@ def copy_and_replace(
 
     dst_root, root_renamed = get_dst_root_path(src_dir, dst_dir, src_names, dst_names)
 
-    # Count total files for progress tracking
-    total_dirs_count, total_files_count = count_files_and_dirs(src_dir)
+    # Fetch the multi-name matcher once for the whole walk
+    replacer = get_replacer(src_names, dst_names)
+
+    # The tree is walked once, while files are copied; progress is reported
+    # against the files found so far, so no counting pass is needed
+    src_dir = os.fspath(src_dir)
+    files_found = 0
     processed_files = 0
 
     # Create ONLY the destination root directory
@@ -230,67 +879,126 @@ def copy_and_replace(
     files_renamed = 0
     name_counts = [0] * len(src_names)
 
-    # Walk through source directory and copy everything
-    for root, dirs, files in os.walk(src_dir):
-        # Calculate relative path from source root
-        rel_path = os.path.relpath(root, src_dir)
+    # Paths below are built by concatenation rather than os.path.join
+    sep = os.sep
+    dst_prefix = os.fspath(dst_root) + sep
+
+    # scan_tree yields subdirectories as src_dir plus a separator plus the
+    # relative path, so slicing off the prefix replaces os.path.relpath
+    src_prefix_len = len(src_dir)
+    if not src_dir.endswith((sep, os.altsep or sep)):
+        src_prefix_len += 1
+
+    def clone_job(src_file: str, dst_file: str) -> JobResult:
+        # Buffer log lines so they are emitted from the calling thread
+        messages: List[Tuple[str, str]] = []
+        file_repl = clone_file(
+            src_file,
+            dst_file,
+            src_names,
+            dst_names,
+            lambda msg, level: messages.append((msg, level)),
+            replacer,
+        )
+        return file_repl, messages
+
+    def finish_job(dst_file: str, job: "Future[JobResult]") -> None:
+        nonlocal total_files, processed_files
 
-        # Determine destination path for this directory
-        if rel_path == ".":
-            # This is the root directory, use dst_root
-            curr_dst_dir = dst_root
-        else:
-            # Apply name replacements to the relative path
-            processed_rel_path = rel_path
-            for src, dst in zip(src_names, dst_names):
-                processed_rel_path = re.sub(re.escape(src), dst, processed_rel_path)
-
-            curr_dst_dir = os.path.join(dst_root, processed_rel_path)
-
-            # Create subdirectory if it doesn't exist
-            if not os.path.exists(curr_dst_dir):
-                os.makedirs(curr_dst_dir, exist_ok=True)
-                total_dirs += 1
-
-        # Process directories for rename counting
-        for dir_name in dirs:
-            orig_name = dir_name
-            new_name = orig_name
-            for src, dst in zip(src_names, dst_names):
-                new_name = re.sub(re.escape(src), dst, new_name)
-            if new_name != orig_name:
-                dirs_renamed += 1
-
-        # Process files
-        for file_name in files:
-            src_file = os.path.join(root, file_name)
-
-            # Apply name replacements to filename
-            new_file_name = file_name
-            for src, dst in zip(src_names, dst_names):
-                new_file_name = re.sub(re.escape(src), dst, new_file_name)
-
-            dst_file = os.path.join(curr_dst_dir, new_file_name)
-
-            # Copy file
-            shutil.copy2(src_file, dst_file)
-            total_files += 1
-            processed_files += 1
-
-            # Update progress
-            if prog_cb:
-                prog_cb("file", processed_files, total_files_count)
-
-            # Count filename rename
-            if new_file_name != file_name:
-                files_renamed += 1
-
-            # Process file contents
-            file_repl = replace_in_contents(dst_file, src_names, dst_names, log_func)
+        file_repl, messages = job.result()
+        if writers.get(dst_file) is job:
+            del writers[dst_file]
+        for msg, level in messages:
+            log_func(msg, level)
+
+        total_files += 1
+        processed_files += 1
+
+        # Update progress
+        if prog_cb:
+            prog_cb("file", processed_files, files_found)
+
+        # Most files hold no names; skip the per-name loop for them
+        if any(file_repl):
             for i, count in enumerate(file_repl):
                 name_counts[i] += count
 
-    return total_dirs, total_files, dirs_renamed, files_renamed, name_counts
+    # Files are handed to the pool while the walk goes on; results are
+    # taken in walk order, at most MAX_PENDING_JOBS behind the walker
+    pending: Deque[Tuple[str, "Future[JobResult]"]] = collections.deque()
+    # Unfinished job per destination; two names may rename to the same file
+    writers: Dict[str, "Future[JobResult]"] = {}
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # Locals for the per-file loop, saving global and attribute lookups
+        rename = replacer.rename
+        submit = executor.submit
+        queue_job = pending.append
+        max_pending = MAX_PENDING_JOBS
+
+        try:
+            # Walk through source directory, creating directories as we go
+            for root, _, files in scan_tree(src_dir):
+                # Determine destination path for this directory
+                if root == src_dir:
+                    # This is the root directory, use dst_root
+                    curr_dst_dir = os.fspath(dst_root)
+                else:
+                    # Apply name replacements to the relative path
+                    rel_path = root[src_prefix_len:]
+                    processed_rel_path = rename(rel_path)
+
+                    # Parents were counted on their own visit; only the
+                    # last component is new here
+                    if (
+                        processed_rel_path.rpartition(sep)[2]
+                        != rel_path.rpartition(sep)[2]
+                    ):
+                        dirs_renamed += 1
+
+                    curr_dst_dir = dst_prefix + processed_rel_path
+
+                    # Parents are visited first, so a single mkdir suffices
+                    try:
+                        os.mkdir(curr_dst_dir)
+                        total_dirs += 1
+                    except FileExistsError:
+                        pass
+
+                # Queue files; their copy and rewrite run on the worker pool
+                files_found += len(files)
+                src_prefix = root + sep
+                dst_dir_prefix = curr_dst_dir + sep
+                for file_name in files:
+                    # Apply name replacements to filename
+                    new_file_name = rename(file_name)
+                    dst_file = dst_dir_prefix + new_file_name
+
+                    # A colliding file waits for the earlier write, so the
+                    # last one in walk order wins, as in a serial copy
+                    earlier = writers.get(dst_file)
+                    if earlier is not None:
+                        wait((earlier,))
+
+                    job = submit(clone_job, src_prefix + file_name, dst_file)
+                    writers[dst_file] = job
+                    queue_job((dst_file, job))
+                    if len(pending) >= max_pending:
+                        finish_job(*pending.popleft())
+
+                    # Count filename rename
+                    if new_file_name != file_name:
+                        files_renamed += 1
+
+            while pending:
+                finish_job(*pending.popleft())
+        except BaseException:
+            # Drop queued copies, e.g. when the progress callback cancels
+            for _, job in pending:
+                job.cancel()
+            raise
+
+    return CloneStats(total_dirs, total_files, dirs_renamed, files_renamed, name_counts)
 
 
 # ==============================================================================
@@ -303,13 +1011,27 @@ def cli_log(message: str, level: str = "normal") -> None:
     print(message)
 
 
+def quiet_cli_log(message: str, level: str = "normal") -> None:
+    """CLI logger for quiet mode; only warnings and errors are printed."""
+    if level in ("warning", "error"):
+        print(message)
+
+
 # ==============================================================================
 # GUI IMPLEMENTATION
 # ==============================================================================
 
 
+class CloneCancelled(Exception):
+    """Raised inside the clone worker when the user cancels the operation."""
+
+
 class CloneProjectGUI:
-    """Tkinter GUI for the clone project utility."""
+    """Tkinter GUI for the clone project utility.
+
+    The clone runs on a worker thread; its log lines, progress and outcome
+    are posted to a queue that the Tk thread drains periodically.
+    """
 
     src_entry: ttk.Entry
     dst_entry: ttk.Entry
@@ -328,13 +1050,14 @@ class CloneProjectGUI:
         self.src_name_entry = ttk.Entry()
         self.dst_name_entry = ttk.Entry()
 
-        # Load window geometry
-        self.cfg = configparser.ConfigParser()
-        if os.path.exists(self.CONFIG_FILE):
-            self.cfg.read(self.CONFIG_FILE)
-            geometry = self.cfg.get("window", "geometry", fallback=None)
+        # Load window geometry; older versions saved "[window]\ngeometry = ..."
+        try:
+            with open(self.CONFIG_FILE) as f:
+                geometry = f.read().rpartition("=")[2].strip()
             if geometry:
                 self.root.geometry(geometry)
+        except (OSError, tk.TclError):
+            pass
 
         self.root.minsize(*MIN_WINDOW_SIZE)
 
@@ -350,6 +1073,22 @@ class CloneProjectGUI:
         self.progress_var = tk.DoubleVar()
         self.progress_label = tk.StringVar(value="Ready")
 
+        # Log lines waiting to be written to the text area in one batch;
+        # lines the widget would trim anyway fall off the front
+        self._log_queue: Deque[Tuple[str, Optional[str]]] = collections.deque(
+            maxlen=MAX_LOG_LINES
+        )
+        self._log_flushed_at = 0.0
+        self._log_flush_pending = False
+
+        # Unchecked: log lines of a running clone are written once at the end
+        self.live_log_var = tk.BooleanVar(value=True)
+        self._busy = False
+
+        # Events posted by the clone worker thread, drained by the Tk thread
+        self._events: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+        self._cancel = threading.Event()
+
         self.setup_ui()
         self.root.protocol("WM_DELETE_WINDOW", self._save_exit)
 
@@ -425,14 +1164,24 @@ class CloneProjectGUI:
             btn.grid(row=row, column=2, padx=5, pady=5)
             self.bind_events(btn)
 
-        clone_btn = ttk.Button(
+        self.clone_btn = ttk.Button(
             parent,
             text="Clone Project",
             command=self.run_clone,
             style="Clone.TButton",
         )
-        clone_btn.grid(row=4, column=0, columnspan=3, pady=(10, 5), sticky="we")
-        self.bind_events(clone_btn)
+        self.clone_btn.grid(row=4, column=0, columnspan=2, pady=(10, 5), sticky="we")
+        self.bind_events(self.clone_btn)
+
+        self.cancel_btn = ttk.Button(
+            parent,
+            text="Cancel",
+            command=self.cancel_clone,
+            width=BTN_WIDTH,
+            state="disabled",
+        )
+        self.cancel_btn.grid(row=4, column=2, padx=5, pady=(10, 5))
+        self.bind_events(self.cancel_btn)
 
     def setup_progress(self, parent: ttk.Frame) -> None:
         """Create progress bar and label."""
@@ -503,6 +1252,10 @@ class CloneProjectGUI:
         for var in status_vars:
             ttk.Label(status, textvariable=var, anchor="w").pack(side=tk.LEFT, padx=5)
 
+        ttk.Checkbutton(status, text="Live log", variable=self.live_log_var).pack(
+            side=tk.RIGHT, padx=5
+        )
+
     def setup_layout(self, parent: ttk.Frame) -> None:
         """Configure grid weights for responsive layout."""
         parent.columnconfigure(1, weight=1)
@@ -531,21 +1284,58 @@ class CloneProjectGUI:
         self.progress_label.set("Ready")
 
     def gui_log(self, msg: str, level: str = "normal") -> None:
-        """Log messages to the GUI text area."""
-        self.log.configure(state="normal")
-
+        """Queue a message for the GUI text area; lines are written in batches."""
         tag = (
             level
             if level in ["error", "warning", "info", "success", "skipped"]
             else None
         )
-        args = (tk.END, f"{msg}\n", tag) if tag else (tk.END, f"{msg}\n")
+        self._log_queue.append((msg, tag))
+
+        # Without live logging the queue is only written when the run ends
+        if self._busy and not self.live_log_var.get():
+            return
+
+        if time.monotonic() - self._log_flushed_at >= LOG_FLUSH_INTERVAL:
+            self._flush_log()
+        elif not self._log_flush_pending:
+            self._log_flush_pending = True
+            self.root.after(int(LOG_FLUSH_INTERVAL * 1000), self._flush_log)
+
+    def _flush_log(self) -> None:
+        """Write all queued log lines, one insert per run of equal tags."""
+        self._log_flush_pending = False
+        self._log_flushed_at = time.monotonic()
+        if not self._log_queue:
+            return
+
+        self.log.configure(state="normal")
+
+        lines: List[str] = []
+        group_tag: Optional[str] = None
+        while self._log_queue:
+            msg, tag = self._log_queue.popleft()
+            if lines and tag != group_tag:
+                self._insert_log("".join(lines), group_tag)
+                lines = []
+            group_tag = tag
+            lines.append(f"{msg}\n")
+        self._insert_log("".join(lines), group_tag)
+
+        # Keep the widget bounded; the text ends with a newline, so the
+        # last line index is one past the number of lines
+        last_line = int(self.log.index("end-1c").split(".")[0])
+        if last_line - 1 > MAX_LOG_LINES:
+            self.log.delete("1.0", f"{last_line - MAX_LOG_LINES}.0")
 
-        self.log.insert(*args)
         self.log.see(tk.END)
         self.log.configure(state="disabled")
         self.root.update_idletasks()
 
+    def _insert_log(self, text: str, tag: Optional[str]) -> None:
+        args = (tk.END, text, tag) if tag else (tk.END, text)
+        self.log.insert(*args)
+
     def on_enter(self, event: tk.Event) -> None:
         """Change cursor to hand."""
         self.root.config(cursor="hand2")
@@ -570,7 +1360,7 @@ class CloneProjectGUI:
             if os.path.exists(dst_root):
                 if not self.confirm_overwrite(dst_root):
                     return
-                shutil.rmtree(dst_root)
+                discard_tree(dst_root)
 
             # Reset progress before starting
             self.reset_progress()
@@ -585,6 +1375,7 @@ class CloneProjectGUI:
 
         except Exception as e:
             self.gui_log(f"Error: {e}", level="error")
+            self._flush_log()
             messagebox.showerror("Error", str(e))
             self.reset_progress()
 
@@ -596,12 +1387,14 @@ class CloneProjectGUI:
 
         if len(src_names) > 1:
             self.gui_log(
-                "Note: Replacements are processed in order. Be careful with overlapping patterns.",
+                "Note: Replacements are applied in a single pass. "
+                "Overlapping names resolve to the longest one.",
                 level="info",
             )
 
     def confirm_overwrite(self, dst: str) -> bool:
         """Confirm overwrite of existing destination directory."""
+        self._flush_log()
         return messagebox.askyesno(
             "Destination exists", f"Destination '{dst}' already exists. Overwrite?"
         )
@@ -613,27 +1406,103 @@ class CloneProjectGUI:
         src_names: List[str],
         dst_names: List[str],
     ) -> None:
-        """Execute the actual clone operation."""
+        """Start the clone operation on a worker thread."""
         self.gui_log("Starting clone operation...")
-        (
-            total_dirs,
-            total_files,
-            dirs_renamed,
-            files_renamed,
-            name_counts,
-        ) = copy_and_replace(
-            src,
-            dst,
-            src_names,
-            dst_names,
-            self.gui_log,
-            prog_cb=self.update_progress,
-        )
+        self._cancel.clear()
+        self.set_busy(True)
+
+        threading.Thread(
+            target=self._clone_worker,
+            args=(src, dst, src_names, dst_names),
+            daemon=True,
+        ).start()
+        self.root.after(EVENT_POLL_INTERVAL, self._drain_events)
+
+    def _clone_worker(
+        self,
+        src: str,
+        dst: str,
+        src_names: List[str],
+        dst_names: List[str],
+    ) -> None:
+        """Run copy_and_replace off the Tk thread, posting events to the queue."""
+        try:
+            result = copy_and_replace(
+                src,
+                dst,
+                src_names,
+                dst_names,
+                lambda msg, level: self._events.put(("log", (msg, level))),
+                prog_cb=self._post_progress,
+            )
+            self._events.put(("done", (dst, result)))
+        except Exception as e:
+            self._events.put(("error", e))
+
+    def _post_progress(self, item_type: str, current: int, total: int) -> None:
+        # Checked once per file, so a cancel takes effect promptly
+        if self._cancel.is_set():
+            raise CloneCancelled("Operation cancelled by user.")
+        self._events.put(("progress", (item_type, current, total)))
+
+    def _drain_events(self) -> None:
+        """Handle all pending worker events; reschedule until the clone ends."""
+        progress = None
+        outcome = None
+
+        while outcome is None:
+            try:
+                kind, payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == "log":
+                self.gui_log(*payload)
+            elif kind == "progress":
+                # Only the latest progress needs drawing
+                progress = payload
+            else:
+                outcome = (kind, payload)
+
+        if progress is not None:
+            self.update_progress(*progress)
+
+        if outcome is None:
+            self.root.after(EVENT_POLL_INTERVAL, self._drain_events)
+            return
+
+        self.set_busy(False)
+        kind, payload = outcome
+        if kind == "done":
+            self.finish_clone(*payload)
+        elif isinstance(payload, CloneCancelled):
+            self.gui_log(str(payload), level="warning")
+            self._flush_log()
+            self.progress_label.set("Operation cancelled")
+        else:
+            self.gui_log(f"Error: {payload}", level="error")
+            self._flush_log()
+            messagebox.showerror("Error", str(payload))
+            self.reset_progress()
+
+    def set_busy(self, busy: bool) -> None:
+        """Toggle the buttons while a clone operation is running."""
+        self._busy = busy
+        self.clone_btn.configure(state="disabled" if busy else "normal")
+        self.cancel_btn.configure(state="normal" if busy else "disabled")
 
+    def cancel_clone(self) -> None:
+        """Ask the running clone operation to stop."""
+        if not self._cancel.is_set():
+            self._cancel.set()
+            self.gui_log("Cancelling...", level="warning")
+
+    def finish_clone(self, dst: str, stats: CloneStats) -> None:
+        """Report the outcome of a completed clone operation."""
         # Update statistics
-        self.dir_var.set(f"Directories: {dirs_renamed}/{total_dirs}")
-        self.file_var.set(f"Files: {files_renamed}/{total_files}")
-        self.name_var.set(f"Names: {', '.join(map(str, name_counts))}")
+        self.dir_var.set(f"Directories: {stats.dirs_renamed}/{stats.total_dirs}")
+        self.file_var.set(f"Files: {stats.files_renamed}/{stats.total_files}")
+        self.name_var.set(f"Names: {', '.join(map(str, stats.name_counts))}")
 
         # Complete progress
         self.progress_var.set(100)
@@ -643,15 +1512,14 @@ class CloneProjectGUI:
             f"Operation completed successfully. New project location: {dst}",
             level="success",
         )
+        self._flush_log()
         messagebox.showinfo("Success", "Project cloned successfully.")
 
     def _save_exit(self) -> None:
         """Save window geometry and exit."""
-        if not self.cfg.has_section("window"):
-            self.cfg.add_section("window")
-        self.cfg.set("window", "geometry", self.root.geometry())
+        self._cancel.set()
         with open(self.CONFIG_FILE, "w") as f:
-            self.cfg.write(f)
+            f.write(self.root.geometry())
         self.root.destroy()
 
     def run(self) -> None:
@@ -665,8 +1533,8 @@ class CloneProjectGUI:
 
 
 def cli_progress_callback(item_type: str, current: int, total: int) -> None:
-    """Update progress for CLI mode."""
-    if total > 0:
+    """Update progress for CLI mode, at most once per 0.5% and at the end."""
+    if total > 0 and (current == total or current % max(1, total // 200) == 0):
         percentage = (current / total) * 100
         sys.stdout.write(
             f"\rProcessing {item_type}s: {current}/{total} ({percentage:.1f}%)"
@@ -688,17 +1556,47 @@ def confirm_cli_overwrite(dst_root: str) -> bool:
     return response in {"y", "yes"}
 
 
+class CliArgumentParser(argparse.ArgumentParser):
+    """Argument parser that reports bad arguments with the CLI help."""
+
+    def error(self, message: str) -> None:  # type: ignore[override]
+        cli_log(f"Error: Invalid arguments ({message})")
+        show_help()
+        sys.exit(1)
+
+
+def build_cli_parser() -> CliArgumentParser:
+    """Build the CLI option parser; usage text comes from show_help.
+
+    Only the options are declared. Everything else, including paths and
+    names that start with '-', is left over as a positional argument.
+    """
+    parser = CliArgumentParser(add_help=False, allow_abbrev=False)
+    parser.add_argument("-q", "--quiet", action="store_true")
+    return parser
+
+
+CLI_PARSER = build_cli_parser()
+
+
 def run_cli() -> None:
     """Execute the clone operation in CLI mode."""
-    if len(sys.argv) < 5:
-        cli_log("Error: Invalid number of arguments")
+    options, args = CLI_PARSER.parse_known_args(sys.argv[1:])
+    quiet = options.quiet
+
+    # Leftovers keep their order; a '--' only ends the options
+    if "--" in args:
+        args.remove("--")
+
+    if len(args) != 4:
+        cli_log(f"Error: Invalid number of arguments (expected 4, got {len(args)})")
         show_help()
         sys.exit(1)
 
-    src_dir = os.path.abspath(sys.argv[1])
-    dst_dir = os.path.abspath(sys.argv[2])
-    src_names = parse_names(sys.argv[3])
-    dst_names = parse_names(sys.argv[4])
+    src_dir = os.path.abspath(args[0])
+    dst_dir = os.path.abspath(args[1])
+    src_names = parse_names(args[2])
+    dst_names = parse_names(args[3])
 
     try:
         validate_inputs(src_dir, dst_dir, src_names, dst_names, cli_log)
@@ -713,19 +1611,22 @@ def run_cli() -> None:
 
     if len(src_names) > 1:
         cli_log(
-            "Note: Replacements are processed in order. Be careful with overlapping patterns."
+            "Note: Replacements are applied in a single pass. "
+            "Overlapping names resolve to the longest one."
         )
 
     # Handle existing destination
+    # The old tree is deleted in the background while the clone runs
     dst_root, _ = get_dst_root_path(src_dir, dst_dir, src_names, dst_names)
+    cleanup = None
     if os.path.exists(dst_root):
         cli_log(f"Warning: Destination directory '{dst_root}' already exists.")
         if not confirm_cli_overwrite(dst_root):
             cli_log("Operation cancelled. Destination was not overwritten.")
             return
-        shutil.rmtree(dst_root)
+        cleanup = discard_tree(dst_root)
 
-    # Perform clone operation
+    # Perform clone operation; quiet mode drops per-file lines and progress
     cli_log("Starting clone operation...")
     (
         total_dirs,
@@ -738,15 +1639,18 @@ def run_cli() -> None:
         dst_dir,
         src_names,
         dst_names,
-        cli_log,
-        prog_cb=cli_progress_callback,
+        quiet_cli_log if quiet else cli_log,
+        prog_cb=None if quiet else cli_progress_callback,
     )
     # Clear the progress line and print final results
-    sys.stdout.write("\r" + " " * 50 + "\r")
+    if not quiet:
+        sys.stdout.write("\r" + " " * 50 + "\r")
 
     cli_log(f"Total Directories: {total_dirs} (renamed: {dirs_renamed})")
     cli_log(f"Total Files: {total_files} (renamed: {files_renamed})")
     cli_log(f"Names replaced: {', '.join(map(str, name_counts))}")
+    if cleanup:
+        cleanup.join()
     cli_log(f"Operation completed successfully. New project location: {dst_root}")
 
 
@@ -8,6 +8,9 @@
 import sys
 import os
 import io
+import errno
+import threading
+import time
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
@@ -19,17 +22,45 @@ from clone_project import (
     validate_inputs,
     cli_log,
     run_cli,
+    cli_progress_callback,
     show_help,
     parse_names,
     get_dst_root_path,
     count_files_and_dirs,
+    scan_tree,
+    NameReplacer,
+    get_replacer,
+    clone_file,
+    stream_replace_file,
+    copy_file,
+    copy_range_fd,
+    write_file,
+    discard_tree,
 )
 
 
+class LogRecorder(list):
+    """Plain callable that records log calls, with the Mock assertions used here."""
+
+    def __call__(self, *args, **kwargs):
+        self.append((args, kwargs))
+
+    def assert_called_with(self, *args, **kwargs):
+        assert self, "log function was not called"
+        assert self[-1] == (args, kwargs), f"last call was {self[-1]}"
+
+    def assert_called_once_with(self, *args, **kwargs):
+        assert len(self) == 1, f"log function was called {len(self)} times"
+        self.assert_called_with(*args, **kwargs)
+
+    def assert_any_call(self, *args, **kwargs):
+        assert (args, kwargs) in self, f"{args} not found in {list(self)}"
+
+
 # Mock logger for testing
 @pytest.fixture
 def mock_log_func():
-    return MagicMock()
+    return LogRecorder()
 
 
 # --- Tests for `get_dst_root_path` function ---
@@ -131,6 +162,125 @@ def test_get_dst_root_path_no_rename_target_dir_included(tmp_path):
     assert was_renamed == 0
 
 
+# --- Tests for `NameReplacer` class ---
+
+
+# Description: Verifies that `NameReplacer.replace` rewrites every source name
+#              in one pass and reports per-name replacement counts.
+# Methodology:
+#     - Builds a replacer for two distinct name pairs.
+#     - Calls `replace` on a text containing both names several times.
+#     - Asserts the rewritten text and the per-name counts.
+def test_name_replacer_multiple_names():
+    replacer = NameReplacer(["alpha", "beta"], ["one", "two"])
+    text, counts = replacer.replace("alpha beta alpha-beta")
+    assert text == "one two one-two"
+    assert counts == [2, 2]
+
+
+# Description: Verifies that `NameReplacer` applies replacements in a single
+#              pass, so a destination name is never rewritten again by a
+#              later pair.
+# Methodology:
+#     - Builds a replacer that swaps two names ("foo" <-> "bar").
+#     - Asserts that both names are swapped rather than chained.
+def test_name_replacer_single_pass_swap():
+    replacer = NameReplacer(["foo", "bar"], ["bar", "foo"])
+    assert replacer.rename("foo_bar") == "bar_foo"
+
+
+# Description: Verifies that `NameReplacer.rename` handles several
+#              one-character names with a translation table.
+# Methodology:
+#     - Builds a replacer whose source names are all single characters,
+#       one of them mapped to a longer name and one swapped with another.
+#     - Asserts that a translation table was built.
+#     - Asserts that the rename matches the single-pass result.
+def test_name_replacer_single_char_names():
+    replacer = NameReplacer(["a", "b", "-"], ["b", "xy", "_"])
+    assert replacer.table is not None
+    assert replacer.rename("ab-c") == "bxy_c"
+    assert replacer.rename("ab-c") == replacer.replace("ab-c")[0]
+
+
+# Description: Verifies the single-name fast path of `NameReplacer.replace`,
+#              which derives counts from the length change of the text.
+# Methodology:
+#     - Replaces a single name with a longer, a shorter and an equal-length
+#       name, on both str and bytes input.
+#     - Asserts the rewritten text and the replacement count each time.
+def test_name_replacer_single_name_counts():
+    assert NameReplacer(["ab"], ["abc"]).replace("ab-ab") == ("abc-abc", [2])
+    assert NameReplacer(["abc"], ["x"]).replace(b"abc abc abc") == (b"x x x", [3])
+    assert NameReplacer(["ab"], ["cd"]).replace("ab ab") == ("cd cd", [2])
+
+
+# Description: Verifies that identical replacement pairs are dropped unless
+#              they overlap a name that does change.
+# Methodology:
+#     - Builds a replacer with an identical pair next to an unrelated name.
+#     - Asserts that only the unrelated name is matched and the identical
+#       pair counts zero.
+#     - Builds a replacer where the identical pair contains a changing name.
+#     - Asserts that the identical pair still shields its occurrences and
+#       still counts zero.
+def test_name_replacer_identical_pairs():
+    replacer = NameReplacer(["foo", "bar"], ["foo", "baz"])
+    assert replacer.names == ["bar"]
+    assert replacer.replace("foo bar") == ("foo baz", [0, 1])
+
+    replacer = NameReplacer(["foobar", "foo"], ["foobar", "baz"])
+    assert replacer.replace("foobar foo") == ("foobar baz", [0, 1])
+
+
+# Description: Verifies that overlapping source names resolve to the longest
+#              match regardless of the order in which they are listed.
+# Methodology:
+#     - Builds a replacer listing a short name before a longer name that
+#       starts with it.
+#     - Asserts that the longer name is replaced where it occurs and the
+#       shorter name elsewhere.
+def test_name_replacer_longest_match_wins():
+    replacer = NameReplacer(["Foo", "FooBar"], ["Baz", "Qux"])
+    text, counts = replacer.replace("FooBar Foo")
+    assert text == "Qux Baz"
+    assert counts == [1, 1]
+
+
+# Description: Verifies that `NameReplacer.rename` returns the input unchanged
+#              when none of the source names are present.
+# Methodology:
+#     - Builds a replacer and calls `rename` on a non-matching name.
+#     - Asserts that the name is returned unchanged.
+def test_name_replacer_no_match():
+    replacer = NameReplacer(["old"], ["new"])
+    assert replacer.rename("main.c") == "main.c"
+
+
+# Description: Verifies that `NameReplacer.contains_any` detects any of the
+#              source names in str and bytes input.
+# Methodology:
+#     - Builds a replacer with two names.
+#     - Asserts a positive result for texts holding either name.
+#     - Asserts a negative result for a text holding neither.
+def test_name_replacer_contains_any():
+    replacer = NameReplacer(["alpha", "beta"], ["one", "two"])
+    assert replacer.contains_any("x beta y")
+    assert replacer.contains_any(b"alpha")
+    assert not replacer.contains_any(b"gamma delta")
+
+
+# Description: Verifies that `get_replacer` reuses the compiled replacer for
+#              identical name lists instead of rebuilding it.
+# Methodology:
+#     - Calls `get_replacer` twice with equal (but distinct) lists.
+#     - Asserts that the same instance is returned both times.
+def test_get_replacer_cached():
+    first = get_replacer(["old"], ["new"])
+    second = get_replacer(["old"], ["new"])
+    assert first is second
+
+
 # --- Tests for `count_files_and_dirs` function ---
 
 
@@ -167,6 +317,38 @@ def test_count_files_and_dirs(tmp_path):
     assert total_files == 4
 
 
+# --- Tests for `scan_tree` function ---
+
+
+# Description: Verifies that `scan_tree` visits the same directories and
+#              files as `os.walk`, parents before children.
+# Methodology:
+#     - Creates a nested directory structure with files at several levels.
+#     - Collects the output of `scan_tree` and `os.walk` for the same root.
+#     - Asserts that both report identical directory and file names.
+#     - Asserts that every directory is visited after its parent.
+def test_scan_tree_matches_os_walk(tmp_path):
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "c").mkdir()
+    (tmp_path / "root.txt").write_text("x")
+    (tmp_path / "a" / "a.txt").write_text("x")
+    (tmp_path / "a" / "b" / "b.txt").write_text("x")
+
+    scanned = {
+        root: (sorted(dirs), sorted(files))
+        for root, dirs, files in scan_tree(str(tmp_path))
+    }
+    walked = {
+        root: (sorted(dirs), sorted(files))
+        for root, dirs, files in os.walk(str(tmp_path))
+    }
+    assert scanned == walked
+
+    order = [root for root, _, _ in scan_tree(str(tmp_path))]
+    for root in order[1:]:
+        assert order.index(os.path.dirname(root)) < order.index(root)
+
+
 # --- Tests for `parse_names` function ---
 
 
@@ -298,11 +480,10 @@ def test_replace_in_contents_duplicate_dst_names(tmp_path, mock_log_func):
     )
     assert file_path.read_text() == "This is a test with test and test."
     assert replacements == [1, 1]
-    mock_log_func.assert_any_call(
-        f"Updated contents of: {file_path} (2 replacements)", "normal"
-    )
-    mock_log_func.assert_called_with(
-        "  Breakdown: 'gino'→'test':1, 'bogo'→'test':1", "normal"
+    mock_log_func.assert_called_once_with(
+        f"Updated contents of: {file_path} "
+        "(2 replacements: 'gino'→'test':1, 'bogo'→'test':1)",
+        "normal",
     )
 
 
@@ -329,6 +510,387 @@ def test_replace_in_contents_binary_file(tmp_path, mock_log_func):
     )
 
 
+# Description: Verifies that the binary check only inspects the leading
+#              bytes of a file, so a late null byte does not block replacement.
+# Methodology:
+#     - Creates a text file with a null byte placed after the sniff window.
+#     - Calls `replace_in_contents`.
+#     - Asserts that the name was replaced and the null byte preserved.
+def test_replace_in_contents_late_null_byte(tmp_path, mock_log_func):
+    file_path = tmp_path / "late_null.txt"
+    file_path.write_bytes(b"old_name" + b" " * 8192 + b"\x00")
+
+    replacements = replace_in_contents(
+        file_path, ["old_name"], ["new_name"], mock_log_func
+    )
+
+    assert replacements == [1]
+    assert file_path.read_bytes() == b"new_name" + b" " * 8192 + b"\x00"
+
+
+# Description: Verifies that ASCII names are replaced at byte level even in
+#              files that are not valid UTF-8 (e.g. Latin-1 sources).
+# Methodology:
+#     - Creates a Latin-1 encoded file containing a non-ASCII character.
+#     - Calls `replace_in_contents` with ASCII names.
+#     - Asserts that the name was replaced and the other bytes are untouched.
+def test_replace_in_contents_ascii_names_latin1_file(tmp_path, mock_log_func):
+    file_path = tmp_path / "latin1.c"
+    file_path.write_bytes("/* café */ old_name();".encode("latin-1"))
+
+    replacements = replace_in_contents(
+        file_path, ["old_name"], ["new_name"], mock_log_func
+    )
+
+    assert replacements == [1]
+    assert file_path.read_bytes() == "/* café */ new_name();".encode("latin-1")
+
+
+# Description: Verifies that files which are not valid UTF-8 are skipped when
+#              a non-ASCII name is involved.
+# Methodology:
+#     - Creates a Latin-1 encoded file.
+#     - Calls `replace_in_contents` with a non-ASCII destination name.
+#     - Asserts that the file is unchanged and the skip is logged.
+def test_replace_in_contents_non_ascii_names_skip_invalid_utf8(
+    tmp_path, mock_log_func
+):
+    file_path = tmp_path / "latin1.c"
+    original = "/* café */ old_name();".encode("latin-1")
+    file_path.write_bytes(original)
+
+    replacements = replace_in_contents(
+        file_path, ["old_name"], ["nouveau_nommé"], mock_log_func
+    )
+
+    assert replacements == [0]
+    assert file_path.read_bytes() == original
+    mock_log_func.assert_called_with(
+        f"Skipped file (not UTF-8 decodable): {file_path}", "skipped"
+    )
+
+
+# --- Tests for `stream_replace_file` function ---
+
+
+# Description: Verifies that `stream_replace_file` finds names that straddle
+#              chunk boundaries and counts them like a whole-file replace.
+# Methodology:
+#     - Shrinks `STREAM_CHUNK_SIZE` to a few bytes so names span chunks.
+#     - Streams a source file containing several (multi-byte) occurrences.
+#     - Asserts the destination content, the counts and the return flag.
+def test_stream_replace_file_chunk_boundaries(tmp_path, mock_log_func, monkeypatch):
+    monkeypatch.setattr("clone_project.STREAM_CHUNK_SIZE", 3)
+    src_file = tmp_path / "big.txt"
+    dst_file = tmp_path / "out.txt"
+    src_file.write_text("old_name é old_name, other old_name", encoding="utf-8")
+
+    replaced, counts = stream_replace_file(
+        str(src_file),
+        str(dst_file),
+        ["old_name", "other"],
+        ["new_name", "another"],
+        mock_log_func,
+        get_replacer(["old_name", "other"], ["new_name", "another"]),
+    )
+
+    assert replaced is True
+    assert counts == [3, 1]
+    assert dst_file.read_text(encoding="utf-8") == (
+        "new_name é new_name, another new_name"
+    )
+
+
+# Description: Verifies that `stream_replace_file` leaves no output behind
+#              when a binary chunk is found part-way through the file.
+# Methodology:
+#     - Shrinks `STREAM_CHUNK_SIZE` so the null byte is in a later chunk.
+#     - Streams a file whose text prefix contains a name.
+#     - Asserts that nothing was written, counts are zero and no temporary
+#       file is left in the directory.
+def test_stream_replace_file_binary(tmp_path, mock_log_func, monkeypatch):
+    monkeypatch.setattr("clone_project.STREAM_CHUNK_SIZE", 4)
+    src_file = tmp_path / "blob.bin"
+    dst_file = tmp_path / "out.bin"
+    src_file.write_bytes(b"old_name old_name\x00tail")
+
+    replaced, counts = stream_replace_file(
+        str(src_file),
+        str(dst_file),
+        ["old_name"],
+        ["new_name"],
+        mock_log_func,
+        get_replacer(["old_name"], ["new_name"]),
+    )
+
+    assert replaced is False
+    assert counts == [0]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["blob.bin"]
+    mock_log_func.assert_called_with(
+        f"Skipped file (likely binary): {dst_file}", "skipped"
+    )
+
+
+# --- Tests for `write_file` function ---
+
+
+# Description: Verifies that `write_file` creates new files and truncates
+#              existing ones, writing the bytes unchanged.
+# Methodology:
+#     - Writes a longer payload, then a shorter one, to the same path.
+#     - Asserts that only the shorter payload remains, with no newline translation.
+def test_write_file_truncates(tmp_path):
+    file_path = tmp_path / "out.txt"
+
+    write_file(str(file_path), b"a much longer first line\r\n")
+    write_file(str(file_path), b"short\n")
+
+    assert file_path.read_bytes() == b"short\n"
+
+
+# --- Tests for `copy_file` function ---
+
+
+# Description: Verifies that `copy_file` copies data and metadata, whether the
+#              filesystem supports reflinks or the regular copy is used.
+# Methodology:
+#     - Creates a binary source file with a fixed modification time.
+#     - Calls `copy_file` to a new destination.
+#     - Asserts identical content and modification time.
+def test_copy_file(tmp_path):
+    src_file = tmp_path / "image.bin"
+    dst_file = tmp_path / "copy.bin"
+    src_file.write_bytes(b"\x00\x01binary")
+    os.utime(src_file, (1_000_000_000, 1_000_000_000))
+
+    copy_file(str(src_file), str(dst_file))
+
+    assert dst_file.read_bytes() == b"\x00\x01binary"
+    assert dst_file.stat().st_mtime == src_file.stat().st_mtime
+
+
+# Description: Verifies that a device refusing reflinks is remembered, so the
+#              FICLONE ioctl is not retried for every later file.
+# Methodology:
+#     - Skips the test outside Linux.
+#     - Patches `fcntl.ioctl` to fail with EOPNOTSUPP and count its calls.
+#     - Copies two files to the same directory with `copy_file`.
+#     - Asserts that both copies are complete and the ioctl ran only once.
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="requires Linux")
+def test_copy_file_remembers_reflink_refusal(tmp_path, monkeypatch):
+    calls = []
+
+    def refuse_ioctl(*args):
+        calls.append(args)
+        raise OSError(errno.EOPNOTSUPP, "Operation not supported")
+
+    monkeypatch.setattr("clone_project._reflink_unsupported", set())
+    monkeypatch.setattr("fcntl.ioctl", refuse_ioctl)
+
+    for name in ("a.bin", "b.bin"):
+        src_file = tmp_path / name
+        src_file.write_bytes(b"payload " + name.encode())
+        copy_file(str(src_file), str(tmp_path / ("copy_" + name)))
+        assert (tmp_path / ("copy_" + name)).read_bytes() == src_file.read_bytes()
+
+    assert len(calls) == 1
+
+
+# Description: Verifies that an EINVAL reflink failure is not remembered, as
+#              it may only concern the file being copied.
+# Methodology:
+#     - Skips the test outside Linux.
+#     - Patches `fcntl.ioctl` to fail with EINVAL and count its calls.
+#     - Copies two files to the same directory with `copy_file`.
+#     - Asserts that both copies are complete and the ioctl ran for each.
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="requires Linux")
+def test_copy_file_retries_reflink_after_einval(tmp_path, monkeypatch):
+    calls = []
+
+    def reject_ioctl(*args):
+        calls.append(args)
+        raise OSError(errno.EINVAL, "Invalid argument")
+
+    monkeypatch.setattr("clone_project._reflink_unsupported", set())
+    monkeypatch.setattr("fcntl.ioctl", reject_ioctl)
+
+    for name in ("a.bin", "b.bin"):
+        src_file = tmp_path / name
+        src_file.write_bytes(b"payload " + name.encode())
+        copy_file(str(src_file), str(tmp_path / ("copy_" + name)))
+        assert (tmp_path / ("copy_" + name)).read_bytes() == src_file.read_bytes()
+
+    assert len(calls) == 2
+
+
+# Description: Verifies that `copy_file` delegates to `CopyFileW` on Windows.
+# Methodology:
+#     - Patches `sys.platform`, a fake `ctypes.windll.kernel32` and
+#       `shutil.copystat`.
+#     - Asserts that `CopyFileW` is called with overwriting allowed.
+def test_copy_file_windows(monkeypatch):
+    kernel32 = MagicMock()
+    kernel32.CopyFileW.return_value = 1
+    monkeypatch.setattr("sys.platform", "win32")
+    monkeypatch.setattr("ctypes.windll", MagicMock(kernel32=kernel32), raising=False)
+    monkeypatch.setattr("shutil.copystat", MagicMock())
+
+    copy_file("C:\\src.bin", "C:\\dst.bin")
+
+    kernel32.CopyFileW.assert_called_once_with("C:\\src.bin", "C:\\dst.bin", False)
+
+
+# --- Tests for `copy_range_fd` function ---
+
+
+# Description: Verifies that `copy_range_fd` copies file data when
+#              `os.copy_file_range` is available.
+# Methodology:
+#     - Skips the test on platforms without `os.copy_file_range`.
+#     - Copies a file larger than a single page between open descriptors.
+#     - Asserts that the call succeeds and the content is identical.
+@pytest.mark.skipif(
+    not hasattr(os, "copy_file_range"), reason="requires os.copy_file_range"
+)
+def test_copy_range_fd(tmp_path):
+    src_file = tmp_path / "data.bin"
+    dst_file = tmp_path / "copy.bin"
+    data = bytes(range(256)) * 64
+    src_file.write_bytes(data)
+
+    with open(src_file, "rb") as src, open(dst_file, "wb") as dst:
+        assert copy_range_fd(src.fileno(), dst.fileno())
+    assert dst_file.read_bytes() == data
+
+
+# Description: Verifies that `copy_range_fd` declines files it cannot copy,
+#              leaving them to the regular copy.
+# Methodology:
+#     - Calls `copy_range_fd` on an empty file.
+#     - Removes `os.copy_file_range` and calls it on a non-empty file.
+#     - Asserts that both calls return False.
+def test_copy_range_fd_unsupported(tmp_path, monkeypatch):
+    empty_file = tmp_path / "empty.txt"
+    src_file = tmp_path / "data.txt"
+    empty_file.write_bytes(b"")
+    src_file.write_bytes(b"data")
+
+    with open(empty_file, "rb") as src, open(tmp_path / "copy1.txt", "wb") as dst:
+        assert not copy_range_fd(src.fileno(), dst.fileno())
+
+    monkeypatch.delattr(os, "copy_file_range", raising=False)
+    with open(src_file, "rb") as src, open(tmp_path / "copy2.txt", "wb") as dst:
+        assert not copy_range_fd(src.fileno(), dst.fileno())
+
+
+# --- Tests for `discard_tree` function ---
+
+
+# Description: Verifies that `discard_tree` frees the path at once and deletes
+#              the old tree in the background.
+# Methodology:
+#     - Creates a directory tree with a file.
+#     - Calls `discard_tree` and joins the returned thread.
+#     - Asserts that neither the tree nor its renamed copy is left behind.
+def test_discard_tree(tmp_path):
+    old_tree = tmp_path / "project"
+    (old_tree / "sub").mkdir(parents=True)
+    (old_tree / "sub" / "file.txt").write_text("content")
+
+    cleanup = discard_tree(str(old_tree))
+    assert not old_tree.exists()
+
+    cleanup.join()
+    assert list(tmp_path.iterdir()) == []
+
+
+# --- Tests for `clone_file` function ---
+
+
+# Description: Verifies that `clone_file` copies a single file to its
+#              destination and replaces names in the copied contents only.
+# Methodology:
+#     - Creates a source text file containing the source name.
+#     - Calls `clone_file` with a destination path in another directory.
+#     - Asserts that the destination holds the rewritten content.
+#     - Asserts that the source file is left untouched.
+#     - Asserts the returned per-name replacement counts.
+def test_clone_file(tmp_path, mock_log_func):
+    src_file = tmp_path / "src.txt"
+    dst_file = tmp_path / "dst.txt"
+    src_file.write_text("old_name and old_name")
+
+    counts = clone_file(
+        str(src_file), str(dst_file), ["old_name"], ["new_name"], mock_log_func
+    )
+
+    assert dst_file.read_text() == "new_name and new_name"
+    assert src_file.read_text() == "old_name and old_name"
+    assert counts == [2]
+
+
+# Description: Verifies that `clone_file` copies files with a known binary
+#              extension as-is, even when they hold no null byte.
+# Methodology:
+#     - Creates a `.PDF` source file containing the source name as text.
+#     - Calls `clone_file`.
+#     - Asserts that the destination is an unchanged copy and no replacements
+#       were counted.
+#     - Asserts that the skip is logged.
+def test_clone_file_binary_extension(tmp_path, mock_log_func):
+    src_file = tmp_path / "manual.PDF"
+    dst_file = tmp_path / "copy.PDF"
+    src_file.write_bytes(b"%PDF-1.4 old_name")
+
+    counts = clone_file(
+        str(src_file), str(dst_file), ["old_name"], ["new_name"], mock_log_func
+    )
+
+    assert dst_file.read_bytes() == b"%PDF-1.4 old_name"
+    assert counts == [0]
+    mock_log_func.assert_called_once_with(
+        f"Skipped file (likely binary): {dst_file}", "skipped"
+    )
+
+
+# Description: Verifies that `clone_file` copies an empty file (which cannot
+#              be memory-mapped) without error.
+# Methodology:
+#     - Creates an empty source file.
+#     - Calls `clone_file`.
+#     - Asserts that an empty destination exists and no replacements were made.
+def test_clone_file_empty(tmp_path, mock_log_func):
+    src_file = tmp_path / "empty.txt"
+    dst_file = tmp_path / "copy.txt"
+    src_file.write_bytes(b"")
+
+    counts = clone_file(
+        str(src_file), str(dst_file), ["old_name"], ["new_name"], mock_log_func
+    )
+
+    assert dst_file.read_bytes() == b""
+    assert counts == [0]
+
+
+# Description: Verifies that `clone_file` preserves the source file metadata
+#              (modification time and mode) on a rewritten destination file.
+# Methodology:
+#     - Creates a source text file and sets a fixed modification time.
+#     - Calls `clone_file` so that the content is rewritten.
+#     - Asserts that the destination has the same mtime and mode as the source.
+def test_clone_file_preserves_metadata(tmp_path, mock_log_func):
+    src_file = tmp_path / "src.txt"
+    dst_file = tmp_path / "dst.txt"
+    src_file.write_text("old_name")
+    os.utime(src_file, (1_000_000_000, 1_000_000_000))
+
+    clone_file(str(src_file), str(dst_file), ["old_name"], ["new_name"], mock_log_func)
+
+    assert dst_file.read_text() == "new_name"
+    assert dst_file.stat().st_mtime == src_file.stat().st_mtime
+    assert dst_file.stat().st_mode == src_file.stat().st_mode
+
+
 # --- Tests for `copy_and_replace` function ---
 
 
@@ -403,7 +965,9 @@ def test_copy_and_replace(tmp_path, mock_log_func):
         "normal",
     )
     mock_log_func.assert_any_call(
-        f"Updated contents of: {(expected_dst_root / nested_dir_name_dst / 'file2.txt').resolve()} (2 replacements)",
+        f"Updated contents of: {(expected_dst_root / nested_dir_name_dst / 'file2.txt').resolve()} "
+        f"(2 replacements: '{src_root_name}'→'{dst_root_name}':1, "
+        f"'{nested_dir_name_src}'→'{nested_dir_name_dst}':1)",
         "normal",
     )
 
@@ -448,6 +1012,124 @@ def test_copy_and_replace_progress_callback(tmp_path, mock_log_func):
     mock_progress_callback.assert_any_call("file", 3, 3)
 
 
+# Description: Verifies that `copy_and_replace` produces the same result when
+#              files are copied serially (`MAX_WORKERS` set to 1).
+# Methodology:
+#     - Sets up a source directory with a few text files.
+#     - Calls `copy_and_replace` with a single worker thread.
+#     - Asserts that all files were copied and their contents rewritten.
+def test_copy_and_replace_serial(tmp_path, mock_log_func, monkeypatch):
+    monkeypatch.setattr("clone_project.MAX_WORKERS", 1)
+    src_dir = tmp_path / "old_proj"
+    src_dir.mkdir()
+    for i in range(5):
+        (src_dir / f"old_proj_{i}.txt").write_text(f"old_proj {i}")
+
+    result = copy_and_replace(
+        str(src_dir),
+        str(tmp_path / "out"),
+        ["old_proj"],
+        ["new_proj"],
+        mock_log_func,
+        prog_cb=MagicMock(),
+    )
+
+    dst_root = tmp_path / "out" / "new_proj"
+    for i in range(5):
+        assert (dst_root / f"new_proj_{i}.txt").read_text() == f"new_proj {i}"
+    assert result == (1, 5, 1, 5, [5])
+    assert result.files_renamed == 5
+    assert result.name_counts == [5]
+
+
+# Description: Verifies that `copy_and_replace` copies every file when only a
+#              few jobs may be pending while the walk continues.
+# Methodology:
+#     - Creates files in the source root and in a subdirectory.
+#     - Shrinks `MAX_PENDING_JOBS` so results are drained during the walk.
+#     - Asserts that all files were copied and progress was reported in order.
+#     - Asserts that the total grows with the files found, never falls below
+#       the processed count, and ends at the number of files.
+def test_copy_and_replace_bounded_pending(tmp_path, mock_log_func, monkeypatch):
+    monkeypatch.setattr("clone_project.MAX_PENDING_JOBS", 2)
+    src_dir = tmp_path / "old_proj"
+    (src_dir / "old_proj_sub").mkdir(parents=True)
+    for i in range(4):
+        (src_dir / f"a{i}.txt").write_text("old_proj")
+        (src_dir / "old_proj_sub" / f"b{i}.txt").write_text("old_proj")
+
+    prog_cb = MagicMock()
+    result = copy_and_replace(
+        str(src_dir),
+        str(tmp_path / "out"),
+        ["old_proj"],
+        ["new_proj"],
+        mock_log_func,
+        prog_cb=prog_cb,
+    )
+
+    dst_root = tmp_path / "out" / "new_proj"
+    for i in range(4):
+        assert (dst_root / f"a{i}.txt").read_text() == "new_proj"
+        assert (dst_root / "new_proj_sub" / f"b{i}.txt").read_text() == "new_proj"
+    assert result == (2, 8, 2, 0, [8])
+    assert [c.args[1] for c in prog_cb.call_args_list] == list(range(1, 9))
+    totals = [c.args[2] for c in prog_cb.call_args_list]
+    assert totals == sorted(totals)
+    assert all(c.args[1] <= c.args[2] for c in prog_cb.call_args_list)
+    assert totals[0] < 8
+    assert totals[-1] == 8
+
+
+# Description: Verifies that files renamed to the same destination are never
+#              written by two copy jobs at once, and the last one wins.
+# Methodology:
+#     - Creates pairs of files whose names both map to one destination name.
+#     - Wraps `clone_file` to record overlapping writes to one destination,
+#       holding each write briefly.
+#     - Asserts that no destination was written concurrently and that each
+#       holds the rewritten content of one source.
+def test_copy_and_replace_colliding_destinations(
+    tmp_path, mock_log_func, monkeypatch
+):
+    src_dir = tmp_path / "proj"
+    src_dir.mkdir()
+    for i in range(20):
+        (src_dir / f"aaa_{i}.txt").write_text(f"aaa {i}")
+        (src_dir / f"bbb_{i}.txt").write_text(f"bbb {i}")
+
+    lock = threading.Lock()
+    active = set()
+    overlaps = []
+
+    def tracking_clone_file(src_file, dst_file, *args):
+        with lock:
+            if dst_file in active:
+                overlaps.append(dst_file)
+            active.add(dst_file)
+        time.sleep(0.005)
+        try:
+            return clone_file(src_file, dst_file, *args)
+        finally:
+            with lock:
+                active.discard(dst_file)
+
+    monkeypatch.setattr("clone_project.clone_file", tracking_clone_file)
+    copy_and_replace(
+        str(src_dir),
+        str(tmp_path / "out"),
+        ["aaa", "bbb"],
+        ["zzz", "zzz"],
+        mock_log_func,
+        prog_cb=None,
+    )
+
+    assert overlaps == []
+    dst_root = tmp_path / "out" / "proj"
+    for i in range(20):
+        assert (dst_root / f"zzz_{i}.txt").read_text() == f"zzz {i}"
+
+
 # --- Tests for `validate_inputs` function ---
 
 
@@ -619,7 +1301,7 @@ def test_show_help(mock_exit, capsys):
     show_help()
     captured = capsys.readouterr()
     assert (
-        "Usage: python clone_project.py <src_dir> <dst_dir> <src_name1,src_name2,...> <dst_name1,dst_name2,...>"
+        "Usage: python clone_project.py [-q] <src_dir> <dst_dir> <src_name1,src_name2,...> <dst_name1,dst_name2,...>"
         in captured.out
     )
     mock_exit.assert_called_once_with(1)
@@ -666,6 +1348,39 @@ def test_run_cli_success(
     assert "Operation completed successfully." in captured.out
 
 
+# Description: Verifies that `run_cli -q` filters per-file log lines, drops the
+#              progress callback and still prints the final summary.
+# Methodology:
+#     - Mocks `copy_and_replace` to log a normal and a warning message.
+#     - Calls `run_cli` with `-q` before the positional arguments.
+#     - Asserts that only the warning and the summary reach stdout.
+@patch("clone_project.copy_and_replace")
+@patch("clone_project.validate_inputs")
+@patch("os.path.exists")
+@patch("sys.argv", ["clone_project.py", "-q", "/src", "/dst", "old", "new"])
+def test_run_cli_quiet(
+    mock_exists, mock_validate_inputs, mock_copy_and_replace, capsys
+):
+    def mock_copy_and_replace_side_effect(*args, **kwargs):
+        log_func = args[4]
+        log_func("Copied file: /dst/a.txt", "normal")
+        log_func("Error copying /src/b.txt: boom", "warning")
+        assert kwargs["prog_cb"] is None
+        return (1, 2, 0, 0, [0])
+
+    mock_copy_and_replace.side_effect = mock_copy_and_replace_side_effect
+    mock_exists.return_value = False
+    run_cli()
+    mock_validate_inputs.assert_called_once_with(
+        "/src", "/dst", ["old"], ["new"], cli_log
+    )
+    captured = capsys.readouterr()
+    assert "Copied file:" not in captured.out
+    assert "Error copying /src/b.txt: boom" in captured.out
+    assert "Total Files: 2" in captured.out
+    assert "Operation completed successfully." in captured.out
+
+
 # Description: Verifies that `run_cli` correctly uses `cli_progress_callback` and updates stdout.
 # Methodology:
 #     - Mocks `copy_and_replace` to simulate file processing and trigger progress updates.
@@ -723,6 +1438,24 @@ def test_run_cli_progress_callback(
     )
 
 
+# --- Tests for `cli_progress_callback` function ---
+
+
+# Description: Verifies that `cli_progress_callback` throttles its output to
+#              one line per 0.5% of progress and always reports completion.
+# Methodology:
+#     - Calls `cli_progress_callback` for every file of a 1000-file run.
+#     - Counts the progress lines written to stdout.
+#     - Asserts 200 lines, the last one reporting 100%.
+def test_cli_progress_callback_throttled(capsys):
+    for current in range(1, 1001):
+        cli_progress_callback("file", current, 1000)
+
+    lines = capsys.readouterr().out.split("\r")[1:]
+    assert len(lines) == 200
+    assert lines[-1] == "Processing files: 1000/1000 (100.0%)"
+
+
 # Description: Verifies that `run_cli` correctly handles an insufficient
 #              number of command-line arguments by logging an error,
 #              displaying help, and exiting with status code 1.
@@ -747,6 +1480,87 @@ def test_run_cli_invalid_arguments(mock_exit, capsys, monkeypatch):
     assert "Usage: python clone_project.py" in captured.out
 
 
+# Description: Verifies that `run_cli` rejects an extra positional argument
+#              instead of silently ignoring it.
+# Methodology:
+#     - Mocks `sys.exit` to raise `SystemExit(1)` when called.
+#     - Sets `sys.argv` with five positional arguments.
+#     - Asserts the exit code and the argument count in the error.
+@patch("sys.exit")
+def test_run_cli_extra_argument(mock_exit, capsys, monkeypatch):
+    mock_exit.side_effect = SystemExit(1)
+    monkeypatch.setattr(
+        "sys.argv", ["clone_project.py", "/src", "/dst", "old", "new", "extra"]
+    )
+    with pytest.raises(SystemExit):
+        run_cli()
+    mock_exit.assert_called_once_with(1)
+    captured = capsys.readouterr()
+    assert "Error: Invalid number of arguments (expected 4, got 5)" in captured.out
+
+
+# Description: Verifies that `run_cli` does not take an abbreviation for
+#              `--quiet`; it is left as one more positional argument.
+# Methodology:
+#     - Mocks `sys.exit` to raise `SystemExit(1)` when called.
+#     - Sets `sys.argv` with `--qu` in place of `--quiet`.
+#     - Asserts that the run fails on the argument count.
+@patch("sys.exit")
+def test_run_cli_abbreviated_option(mock_exit, capsys, monkeypatch):
+    mock_exit.side_effect = SystemExit(1)
+    monkeypatch.setattr(
+        "sys.argv", ["clone_project.py", "--qu", "/src", "/dst", "old", "new"]
+    )
+    with pytest.raises(SystemExit):
+        run_cli()
+    captured = capsys.readouterr()
+    assert "Error: Invalid number of arguments (expected 4, got 5)" in captured.out
+
+
+# Description: Verifies that paths and names starting with '-' are taken as
+#              positional arguments without `--`, as before argparse.
+# Methodology:
+#     - Mocks `validate_inputs` and `copy_and_replace`.
+#     - Sets `sys.argv` with dash-prefixed names around `-q`.
+#     - Asserts that `validate_inputs` receives them in order as positionals.
+@patch("clone_project.copy_and_replace")
+@patch("clone_project.validate_inputs")
+@patch("os.path.exists")
+@patch("sys.argv", ["clone_project.py", "/src/OldProj", "/out", "-Old", "-q", "-New"])
+def test_run_cli_dash_names(mock_exists, mock_validate_inputs, mock_copy_and_replace):
+    mock_exists.return_value = False
+    mock_copy_and_replace.return_value = (1, 0, 1, 0, [0])
+    run_cli()
+    mock_validate_inputs.assert_called_once_with(
+        "/src/OldProj", "/out", ["-Old"], ["-New"], cli_log
+    )
+    assert mock_copy_and_replace.call_args.kwargs["prog_cb"] is None
+
+
+# Description: Verifies that arguments starting with '-' are accepted after
+#              `--`, as paths and names.
+# Methodology:
+#     - Mocks `validate_inputs` and `copy_and_replace`.
+#     - Sets `sys.argv` with `-q --` followed by dash-prefixed arguments.
+#     - Asserts that `validate_inputs` receives them as positionals.
+@patch("clone_project.copy_and_replace")
+@patch("clone_project.validate_inputs")
+@patch("os.path.exists")
+@patch(
+    "sys.argv",
+    ["clone_project.py", "-q", "--", "/src/-proj", "/out", "-proj", "-new"],
+)
+def test_run_cli_double_dash(
+    mock_exists, mock_validate_inputs, mock_copy_and_replace
+):
+    mock_exists.return_value = False
+    mock_copy_and_replace.return_value = (1, 0, 1, 0, [0])
+    run_cli()
+    mock_validate_inputs.assert_called_once_with(
+        "/src/-proj", "/out", ["-proj"], ["-new"], cli_log
+    )
+
+
 # Description: Checks that `run_cli` gracefully handles `ValueError`
 #              exceptions raised by `validate_inputs`, logging the error
 #              and exiting with status code 1.
@@ -772,22 +1586,24 @@ def test_run_cli_validation_error(mock_validate_inputs, capsys):
 #              exists in CLI mode, ensuring it's removed before cloning proceeds.
 # Methodology:
 #     - Mocks `os.path.exists` to return `True` (destination exists).
-#     - Mocks `shutil.rmtree` to verify its call.
+#     - Mocks `os.rename` and `shutil.rmtree` to verify their calls.
 #     - Patches `sys.argv` to provide valid CLI arguments.
 #     - Calls `run_cli`.
-#     - Asserts that `shutil.rmtree` was called once with the destination path.
+#     - Asserts that the destination was moved aside and `shutil.rmtree` was
+#       called once on the moved tree.
 #     - Asserts that the "Warning: Destination directory already exists. Overwriting..."
 #       message is printed to stdout.
 @patch("clone_project.copy_and_replace")
 @patch("clone_project.validate_inputs")
 @patch("os.path.exists")
+@patch("os.rename")
 @patch("shutil.rmtree")
 @patch(
     "sys.argv",
     ["clone_project.py", "/src/old_proj", "/dst_parent", "old_proj", "new_proj"],
 )
 def test_run_cli_dst_exists_overwrite(
-    mock_rmtree, mock_exists, mock_validate_inputs, mock_copy_and_replace, capsys, monkeypatch
+    mock_rmtree, mock_rename, mock_exists, mock_validate_inputs, mock_copy_and_replace, capsys, monkeypatch
 ):
     monkeypatch.setattr("builtins.input", lambda _: "y")
     monkeypatch.setattr("sys.stdin", io.StringIO("y\n"))
@@ -800,8 +1616,11 @@ def test_run_cli_dst_exists_overwrite(
     mock_copy_and_replace.return_value = (1, 1, 1, 1, [1, 1])
     run_cli()
 
-    # rmtree should be called on the calculated dst_root
-    mock_rmtree.assert_called_once_with(expected_dst_root)
+    # The calculated dst_root is moved aside, then removed in the background
+    mock_rename.assert_called_once_with(expected_dst_root, ANY)
+    old_path = mock_rename.call_args[0][1]
+    assert old_path.startswith(expected_dst_root + ".old-")
+    mock_rmtree.assert_called_once_with(old_path, ignore_errors=True)
 
     mock_validate_inputs.assert_called_once_with(
         "/src/old_proj", "/dst_parent", ["old_proj"], ["new_proj"], cli_log